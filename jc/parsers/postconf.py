@@ -84,14 +84,15 @@ Examples:
       }
     ]
 """
-from typing import List, Dict
+from typing import List, Dict, Optional
 import jc.utils
+from jc.jc_types import JSONDictType
 from jc.parsers.universal import simple_table_parse
 
 
 class info():
     """Provides parser metadata (version, author, etc.)"""
-    version = '1.0'
+    version = '1.1'
     description = '`postconf -M` command parser'
     author = 'Kelly Brazil'
     author_email = 'kellyjonbrazil@gmail.com'
@@ -102,8 +103,14 @@ class info():
 
 __version__ = info.version
 
+_to_bool = jc.utils.convert_to_bool
+_to_int = jc.utils.convert_to_int
 
-def _process(proc_data: List[Dict]) -> List[Dict]:
+_BOOL_FIELDS = ('private', 'unprivileged', 'chroot')
+_INT_FIELDS = ('wake_up_time', 'process_limit')
+
+
+def _process(proc_data: List[JSONDictType]) -> List[JSONDictType]:
     """
     Final processing to conform to the schema.
 
@@ -115,29 +122,30 @@ def _process(proc_data: List[Dict]) -> List[Dict]:
 
         List of Dictionaries. Structured to conform to the schema.
     """
-    keys = ['private', 'unprivileged', 'chroot', 'wake_up_time', 'process_limit']
-    bools = ['private', 'unprivileged', 'chroot']
-    integers = ['wake_up_time', 'process_limit']
+    # columns only hold a handful of distinct values, so convert each once
+    bool_values: Dict[str, Optional[bool]] = {'-': None}
+    int_values: Dict[str, Optional[int]] = {'-': None}
 
     for item in proc_data:
-        if item['wake_up_time'].endswith('?'):
+        wake_up_time = item['wake_up_time']
+        if wake_up_time.endswith('?'):
             item['no_wake_up_before_first_use'] = True
-        elif item['wake_up_time'] == '-':
+        elif wake_up_time == '-':
             item['no_wake_up_before_first_use'] = None
         else:
             item['no_wake_up_before_first_use'] = False
 
-        for key in keys:
-            if item[key] == '-':
-                item[key] = None
-
-        for key in bools:
-            if item[key] is not None:
-                item[key] = jc.utils.convert_to_bool(item[key])
+        for key in _BOOL_FIELDS:
+            val = item[key]
+            if val not in bool_values:
+                bool_values[val] = _to_bool(val)
+            item[key] = bool_values[val]
 
-        for key in integers:
-            if item[key] is not None:
-                item[key] = jc.utils.convert_to_int(item[key])
+        for key in _INT_FIELDS:
+            val = item[key]
+            if val not in int_values:
+                int_values[val] = _to_int(val)
+            item[key] = int_values[val]
 
     return proc_data
 
@@ -167,8 +175,7 @@ def parse(
 
     if jc.utils.has_data(data):
         table = ['service_name service_type private unprivileged chroot wake_up_time process_limit command']
-        data_list = list(filter(None, data.splitlines()))
-        table.extend(data_list)
+        table += [line for line in data.splitlines() if line]
         raw_output = simple_table_parse(table)
 
     return raw_output if raw else _process(raw_output)
@@ -10,6 +10,9 @@ the local time of the system the parser is run on)
 The `timestamp_epoch_utc` calculated timestamp field is timezone-aware and
 is only available if the timezone field is UTC.
 
+Structured data parameter names are kept whole, as RFC 5424 defines
+`PARAM-NAME`. For example, `sys-Up.Time="5"` gives the `sys-Up.Time` key.
+
 Usage (cli):
 
     $ echo <165>1 2003-08-24T05:14:15.000003-07:00 192.0.2... | jc --syslog
@@ -102,13 +105,13 @@ Examples:
     ]
 """
 import re
-from typing import List, Dict, Optional
+from typing import List, Dict, Tuple, Optional
 import jc.utils
 
 
 class info():
     """Provides parser metadata (version, author, etc.)"""
-    version = '1.0'
+    version = '1.1'
     description = 'Syslog RFC 5424 string parser'
     author = 'Kelly Brazil'
     author_email = 'kellyjonbrazil@gmail.com'
@@ -121,49 +124,98 @@ __version__ = info.version
 
 # fix escape chars specified in syslog RFC 5424
 # https://www.rfc-editor.org/rfc/rfc5424.html#section-6
-escape_map = {
-    r'\\': '\\',
-    r'\"': '"',
-    r'\]': ']'
-}
-
+# (backslash, double quote and closing bracket are escaped with a backslash)
+_ESC_SUB = re.compile(r'\\([\\"\]])').sub
 
-def _extract_structs(structs_string: str) -> List[str]:
-    struct_match = re.compile(r'(?P<eachstruct>\[.+?(?<!\\)\])')
-    each_struct = struct_match.findall(structs_string)
-    my_structs = []
 
-    if each_struct:
-        for structured in each_struct:
-            my_structs.append(structured)
+def _unescape(val: str) -> str:
+    # single pass, so an escaped backslash is not combined with the next char
+    return _ESC_SUB(r'\1', val)
 
-    return my_structs
 
+# structured data scanner states
+_OUTSIDE, _IDENT, _KEY, _EQ, _VAL, _ESC_IN_VAL = range(6)
 
-def _extract_ident(struct_string) -> Optional[str]:
-    ident = re.compile(r'\[(?P<ident>[^\[\=\x22\]\x20]{1,32})\s')
-    ident_match = ident.search(struct_string)
-    if ident_match:
-        return ident_match.group('ident')
-    return None
+# separators between the SD-ID and parameters, same as \s under re.ASCII
+_SD_SPACE = ' \t\n\r\f\v'
 
+# SD-ID names are 1-32 chars without '=', ']', '"' or space
+_SD_NAME_MATCH = re.compile(r'[^\[\=\x22\]\x20]{1,32}').fullmatch
 
-def _extract_kv(struct_string) -> List[Dict]:
-    key_vals = re.compile(r'(?P<key>\w+)=(?P<val>\"[^\"]*\")')
-    key_vals_match = key_vals.findall(struct_string)
-    kv_list = []
 
-    if key_vals_match:
-        for kv in key_vals_match:
-            key, val = kv
+def _sd_name(name: str) -> Optional[str]:
+    return name if _SD_NAME_MATCH(name) else None
 
-            # fixup escaped characters
-            for esc, esc_sub in escape_map.items():
-                val = val.replace(esc, esc_sub)
 
-            kv_list.append({key: val[1:-1]})
+def _scan_structured(structs_string: str) -> List[Tuple[Optional[str], Dict[str, str]]]:
+    """
+    Single pass over the structured data section. Returns a list of
+    (identity, parameters) tuples, one for each [...] element.
 
-    return kv_list
+    Elements close on the same rule the line regex uses: the first ']' after
+    at least one character that is not preceded by a backslash.
+    """
+    structs = []
+    state = _OUTSIDE
+    ident: Optional[str] = None
+    params: Dict[str, str] = {}
+    elem_start = start = key_start = 0
+    key = ''
+    escaped = False
+
+    for i, char in enumerate(structs_string):
+        if state == _OUTSIDE:
+            if char == '[':
+                state = _IDENT
+                elem_start = start = i + 1
+                ident = None
+                params = {}
+
+        elif char == ']' and i > elem_start and structs_string[i - 1] != '\\':
+            # an unterminated value is dropped, the rest of the element is kept
+            if state == _IDENT:
+                ident = _sd_name(structs_string[start:i])
+            structs.append((ident, params))
+            state = _OUTSIDE
+
+        elif state == _VAL:
+            if char == '"':
+                if key:
+                    val = structs_string[start:i]
+                    params[key] = _unescape(val) if escaped else val
+                state = _KEY
+                key_start = i + 1
+            elif char == '\\':
+                state = _ESC_IN_VAL
+                escaped = True
+
+        elif state == _ESC_IN_VAL:
+            state = _VAL
+
+        elif state == _IDENT:
+            if char in _SD_SPACE:
+                ident = _sd_name(structs_string[start:i])
+                state = _KEY
+                key_start = i + 1
+
+        elif state == _KEY:
+            if char in _SD_SPACE:
+                key_start = i + 1
+            elif char == '=':
+                key = structs_string[key_start:i]
+                state = _EQ
+
+        # _EQ: a value must be quoted, otherwise skip to the next key
+        elif char == '"':
+            state = _VAL
+            start = i + 1
+            escaped = False
+
+        else:
+            state = _KEY
+            key_start = i + 1
+
+    return structs
 
 
 def _process(proc_data: List[Dict]) -> List[Dict]:
@@ -195,28 +247,14 @@ def _process(proc_data: List[Dict]) -> List[Dict]:
 
         # fixup escaped characters
         if 'message' in item and item['message']:
-            for esc, esc_sub in escape_map.items():
-                item['message'] = item['message'].replace(esc, esc_sub)
+            item['message'] = _ESC_SUB(r'\1', item['message'])
 
         # parse identity and key value pairs in the structured data section
         if 'structured_data' in item and item['structured_data']:
-            structs_list = []
-            structs = _extract_structs(item['structured_data'])
-
-            for a_struct in structs:
-                struct_obj = {
-                    'identity': _extract_ident(a_struct)
-                }
-
-                my_values = {}
-
-                for val_obj in _extract_kv(a_struct):
-                    my_values.update(val_obj)
-
-                struct_obj.update({'parameters': my_values})  # type: ignore
-                structs_list.append(struct_obj)
-
-            item['structured_data'] = structs_list
+            item['structured_data'] = [
+                {'identity': ident, 'parameters': params}
+                for ident, params in _scan_structured(item['structured_data'])
+            ]
 
         # integer conversions
         for key in item:
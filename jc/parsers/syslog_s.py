@@ -13,6 +13,9 @@ the local time of the system the parser is run on)
 The `timestamp_epoch_utc` calculated timestamp field is timezone-aware and
 is only available if the timezone field is UTC.
 
+Structured data parameter names are kept whole, as RFC 5424 defines
+`PARAM-NAME`. For example, `sys-Up.Time="5"` gives the `sys-Up.Time` key.
+
 Usage (cli):
 
     $ echo <165>1 2003-08-24T05:14:15.000003-07:00 192.0... | jc --syslog-s
@@ -81,12 +84,14 @@ import jc.utils
 from jc.streaming import (
     add_jc_meta, streaming_input_type_check, streaming_line_input_type_check, raise_or_yield
 )
+from jc.jc_types import JSONDictType
+from jc.parsers.syslog import _ESC_SUB, _scan_structured
 from jc.exceptions import ParseError
 
 
 class info():
     """Provides parser metadata (version, author, etc.)"""
-    version = '1.0'
+    version = '1.1'
     description = 'Syslog RFC 5424 string streaming parser'
     author = 'Kelly Brazil'
     author_email = 'kellyjonbrazil@gmail.com'
@@ -97,55 +102,64 @@ class info():
 
 __version__ = info.version
 
+_to_int = jc.utils.convert_to_int
+_timestamp = jc.utils.timestamp
+
+
+# inspired by https://regex101.com/library/Wgbxn2
+_SYSLOG_RE = re.compile(r'''
+    (?:<(?P<priority>\d|\d{2}|1[1-8]\d|19[01])>)?
+    (?P<version>\d{1,2})?\s*
+    (?P<timestamp>-|
+        [12]\d{3}-                          # fullyear
+        (?:0\d|[1][012])-                   # month
+        (?:[012]\d|3[01])T                  # mday
+        (?:[01]\d|2[0-4]):                  # hour
+        [0-5]\d:                            # minute
+        (?:[0-5]\d|60)                      # second (60 can be used for leap second)
+        (?:\.\d{1,6})?                      # secfrac
+        (?:Z|[+-]\d{2}:\d{2}))\s            # numoffset
+    (?P<hostname>[\S]{1,255})\s
+    (?P<appname>[\S]{1,48})\s
+    (?P<procid>[\S]{1,128})\s
+    (?P<msgid>[\S]{1,32})\s
+    (?P<structureddata>-|(?:\[.*?[^\\\n]\])+)
+    (?:\s(?P<msg>.+))?
+    ''', re.VERBOSE | re.ASCII
+)
 
-# fix escape chars specified in syslog RFC 5424
-# https://www.rfc-editor.org/rfc/rfc5424.html#section-6
-escape_map = {
-    r'\\': '\\',
-    r'\"': '"',
-    r'\]': ']'
-}
-
+# output record keys and the matching regex group names
+_OUT_KEYS = (
+    'priority', 'version', 'timestamp', 'hostname', 'appname', 'proc_id',
+    'msg_id', 'structured_data', 'message'
+)
+_RE_GROUPS = (
+    'priority', 'version', 'timestamp', 'hostname', 'appname', 'procid',
+    'msgid', 'structureddata', 'msg'
+)
 
-def _extract_structs(structs_string: str) -> List[str]:
-    struct_match = re.compile(r'(?P<eachstruct>\[.+?(?<!\\)\])')
-    each_struct = struct_match.findall(structs_string)
-    my_structs = []
+_STR_FIELDS = ('timestamp', 'hostname', 'appname', 'msg_id', 'structured_data', 'message')
 
-    if each_struct:
-        for structured in each_struct:
-            my_structs.append(structured)
 
-    return my_structs
+def _match_rfc5424(line: str) -> Optional[JSONDictType]:
+    """
+    Returns the raw output record or None if the line is not parsable.
+    """
+    syslog_match = _SYSLOG_RE.match(line)
 
+    if syslog_match:
+        # priority and version are digits or None. The other fields can
+        # hold the RFC 5424 NILVALUE '-'
+        values = syslog_match.group(*_RE_GROUPS)
+        return dict(zip(_OUT_KEYS, values[:2] + tuple(
+            None if value == '-' else value
+            for value in values[2:]
+        )))
 
-def _extract_ident(struct_string) -> Optional[str]:
-    ident = re.compile(r'\[(?P<ident>[^\[\=\x22\]\x20]{1,32})\s')
-    ident_match = ident.search(struct_string)
-    if ident_match:
-        return ident_match.group('ident')
     return None
 
 
-def _extract_kv(struct_string) -> List[Dict]:
-    key_vals = re.compile(r'(?P<key>\w+)=(?P<val>\"[^\"]*\")')
-    key_vals_match = key_vals.findall(struct_string)
-    kv_list = []
-
-    if key_vals_match:
-        for kv in key_vals_match:
-            key, val = kv
-
-            # fixup escaped characters
-            for esc, esc_sub in escape_map.items():
-                val = val.replace(esc, esc_sub)
-
-            kv_list.append({key: val[1:-1]})
-
-    return kv_list
-
-
-def _process(proc_data: Dict) -> Dict:
+def _process(proc_data: JSONDictType) -> JSONDictType:
     """
     Final processing to conform to the schema.
 
@@ -157,49 +171,45 @@ def _process(proc_data: Dict) -> Dict:
 
         Dictionary. Structured data to conform to the schema.
     """
-    int_list = {'priority', 'version', 'proc_id'}
-
-    for key, value in proc_data.items():
-        # remove any spaces around values
-        if proc_data[key]:
+    if 'unparsable' in proc_data:
+        proc_data['unparsable'] = proc_data['unparsable'].strip()
+        return proc_data
+
+    # remove any spaces around values
+    for key in _STR_FIELDS:
+        value = proc_data[key]
+        if value:
             proc_data[key] = value.strip()
 
     # add timestamp fields
-    if 'timestamp' in proc_data and proc_data['timestamp']:
+    timestamp = proc_data['timestamp']
+    if timestamp:
         format = (1300, 1310)
-        dt = jc.utils.timestamp(proc_data['timestamp'], format)
+        dt = _timestamp(timestamp, format)
         proc_data['timestamp_epoch'] = dt.naive
         proc_data['timestamp_epoch_utc'] = dt.utc
 
     # fixup escaped characters
-    if 'message' in proc_data and proc_data['message']:
-        for esc, esc_sub in escape_map.items():
-            proc_data['message'] = proc_data['message'].replace(esc, esc_sub)
+    message = proc_data['message']
+    if message and '\\' in message:
+        proc_data['message'] = _ESC_SUB(r'\1', message)
 
     # parse identity and key value pairs in the structured data section
-    if 'structured_data' in proc_data and proc_data['structured_data']:
-        structs_list = []
-        structs = _extract_structs(proc_data['structured_data'])
-
-        for a_struct in structs:
-            struct_obj = {
-                'identity': _extract_ident(a_struct)
-            }
-
-            my_values = {}
-
-            for val_obj in _extract_kv(a_struct):
-                my_values.update(val_obj)
-
-            struct_obj.update({'parameters': my_values})  # type: ignore
-            structs_list.append(struct_obj)
-
-        proc_data['structured_data'] = structs_list
-
-    # integer conversions
-    for key in proc_data:
-        if key in int_list:
-            proc_data[key] = jc.utils.convert_to_int(proc_data[key])
+    structured_data = proc_data['structured_data']
+    if structured_data:
+        proc_data['structured_data'] = [
+            {'identity': ident, 'parameters': params}
+            for ident, params in _scan_structured(structured_data)
+        ]
+
+    # integer conversions. priority and version are always ASCII digits
+    # when present, so they do not need the convert_to_int() cleanup
+    priority = proc_data['priority']
+    proc_data['priority'] = int(priority) if priority else None
+    version = proc_data['version']
+    proc_data['version'] = int(version) if version else None
+    proc_id = proc_data['proc_id']
+    proc_data['proc_id'] = _to_int(proc_id) if proc_id else None
 
     return proc_data
 
@@ -231,73 +241,30 @@ def parse(
     jc.utils.compatibility(__name__, info.compatible, quiet)
     streaming_input_type_check(data)
 
-    # inspired by https://regex101.com/library/Wgbxn2
-    syslog = re.compile(r'''
-        (?P<priority><(\d|\d{2}|1[1-8]\d|19[01])>)?
-        (?P<version>\d{1,2})?\s*
-        (?P<timestamp>-|
-            (?P<fullyear>[12]\d{3})-
-            (?P<month>0\d|[1][012])-
-            (?P<mday>[012]\d|3[01])T
-            (?P<hour>[01]\d|2[0-4]):
-            (?P<minute>[0-5]\d):
-            (?P<second>[0-5]\d|60)(?#60seconds can be used for leap year!)(?:\.
-            (?P<secfrac>\d{1,6}))?
-            (?P<numoffset>Z|[+-]\d{2}:\d{2})(?#=timezone))\s
-        (?P<hostname>[\S]{1,255})\s
-        (?P<appname>[\S]{1,48})\s
-        (?P<procid>[\S]{1,128})\s
-        (?P<msgid>[\S]{1,32})\s
-        (?P<structureddata>-|(?:\[.+?(?<!\\)\])+)
-        (?:\s(?P<msg>.+))?
-        ''', re.VERBOSE
-    )
-
     for line in data:
         try:
-            streaming_line_input_type_check(line)
-            output_line: Dict = {}
+            # only call the full check for lines that are not plain strings
+            if type(line) is not str:
+                streaming_line_input_type_check(line)
 
             #skip blank lines
-            if not line.strip():
+            stripped_line = line.rstrip()
+            if not stripped_line:
                 continue
 
-            syslog_match = syslog.match(line)
-            if syslog_match:
-                syslog_dict = syslog_match.groupdict()
-                for item in syslog_dict:
-                    if syslog_dict[item] == '-':
-                        syslog_dict[item] = None
-
-                priority = None
-
-                if syslog_dict['priority']:
-                    priority = syslog_dict['priority'][1:-1]
-
-                output_line = {
-                    'priority': priority,
-                    'version': syslog_dict['version'],
-                    'timestamp': syslog_dict['timestamp'],
-                    'hostname': syslog_dict['hostname'],
-                    'appname': syslog_dict['appname'],
-                    'proc_id': syslog_dict['procid'],
-                    'msg_id': syslog_dict['msgid'],
-                    'structured_data': syslog_dict['structureddata'],
-                    'message': syslog_dict['msg']
-                }
+            output_line: Optional[JSONDictType] = _match_rfc5424(line)
 
-            else:
+            if not output_line:
                 output_line = {
-                    'unparsable': line.rstrip()
+                    'unparsable': stripped_line
                 }
 
                 if not quiet:
                     jc.utils.warning_message(
-                        [f'Unparsable line found: {line.rstrip()}']
+                        [f'Unparsable line found: {stripped_line}']
                     )
 
-            if output_line:
-                yield output_line if raw else _process(output_line)
+            yield output_line if raw else _process(output_line)
 
         except Exception as e:
             yield raise_or_yield(ignore_exceptions, e, line)
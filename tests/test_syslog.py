@@ -2,6 +2,7 @@ import os
 import unittest
 import json
 import jc.parsers.syslog
+import jc.parsers.syslog_s
 
 THIS_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -29,6 +30,68 @@ class MyTests(unittest.TestCase):
         """
         self.assertEqual(jc.parsers.syslog.parse(self.syslog, quiet=True), self.syslog_json)
 
+    def test_syslog_escaped_backslash(self):
+        """
+        Test 'syslog' with escaped backslashes in structured data values
+        """
+        data = r'<165>1 2003-10-11T22:14:15.003Z host app - - [id@1 dir="C:\\temp\\" x="1\]2"] msg'
+        expected = [{'identity': 'id@1', 'parameters': {'dir': 'C:\\temp\\', 'x': '1]2'}}]
+        result = jc.parsers.syslog.parse(data, quiet=True)
+        self.assertEqual(result[0]['structured_data'], expected)
+
+    def test_syslog_escaped_quote(self):
+        """
+        Test 'syslog' with escaped double quotes in structured data values
+        """
+        data = r'<165>1 2003-10-11T22:14:15.003Z host app - - [id@1 q="say \"hi\""] msg'
+        expected = [{'identity': 'id@1', 'parameters': {'q': 'say "hi"'}}]
+        result = jc.parsers.syslog.parse(data, quiet=True)
+        self.assertEqual(result[0]['structured_data'], expected)
+
+    def test_syslog_tab_separator(self):
+        """
+        Test 'syslog' with tabs separating the structured data identity and parameters
+        """
+        data = '<165>1 2003-10-11T22:14:15.003Z host app - - [id\ta="1"\tb="2"] msg'
+        expected = [{'identity': 'id', 'parameters': {'a': '1', 'b': '2'}}]
+        result = jc.parsers.syslog.parse(data, quiet=True)
+        self.assertEqual(result[0]['structured_data'], expected)
+
+    def test_syslog_no_parameters(self):
+        """
+        Test 'syslog' with a structured data element that has no parameters
+        """
+        data = '<165>1 2003-10-11T22:14:15.003Z host app - - [origin][id@1 a="1"] msg'
+        expected = [
+            {'identity': 'origin', 'parameters': {}},
+            {'identity': 'id@1', 'parameters': {'a': '1'}}
+        ]
+        result = jc.parsers.syslog.parse(data, quiet=True)
+        self.assertEqual(result[0]['structured_data'], expected)
+
+    def test_syslog_param_name(self):
+        """
+        Test 'syslog' with dashes and dots in a structured data parameter name
+        """
+        data = '<165>1 2003-10-11T22:14:15.003Z host app - - [meta sys-Up.Time="5"] msg'
+        expected = [{'identity': 'meta', 'parameters': {'sys-Up.Time': '5'}}]
+        result = jc.parsers.syslog.parse(data, quiet=True)
+        self.assertEqual(result[0]['structured_data'], expected)
+
+    def test_syslog_matches_syslog_s(self):
+        """
+        Test 'syslog' and 'syslog_s' parse the same structured data
+        """
+        data = r'<165>1 2003-10-11T22:14:15.003Z host app - - [origin][id@1 dir="C:\\temp\\" q="say \"hi\"" sys-Up.Time="v"] msg'
+        expected = [
+            {'identity': 'origin', 'parameters': {}},
+            {'identity': 'id@1', 'parameters': {'dir': 'C:\\temp\\', 'q': 'say "hi"', 'sys-Up.Time': 'v'}}
+        ]
+        result = jc.parsers.syslog.parse(data, quiet=True)
+        result_s = list(jc.parsers.syslog_s.parse([data], quiet=True))
+        self.assertEqual(result[0]['structured_data'], expected)
+        self.assertEqual(result_s[0]['structured_data'], expected)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -32,6 +32,97 @@ class MyTests(unittest.TestCase):
         """
         self.assertEqual(list(jc.parsers.syslog_s.parse(self.syslog.splitlines(), quiet=True)), self.syslog_streaming_json)
 
+    def test_syslog_s_ascii_separators(self):
+        """
+        Test syslog lines where header fields are only separated by ASCII whitespace
+        """
+        data = '<34>1 2003-10-11T22:14:15.003Z host su\x1c- ID47 - msg'
+        self.assertEqual(list(jc.parsers.syslog_s.parse([data], quiet=True)), [{'unparsable': data}])
+
+        data = '<34>1 2003-10-11T22:14:15.003Z my\xa0host su - ID47 - msg'
+        result = list(jc.parsers.syslog_s.parse([data], quiet=True))
+        self.assertEqual(result[0]['hostname'], 'my\xa0host')
+
+    def test_syslog_s_escaped_backslash(self):
+        """
+        Test syslog line with escaped backslashes in structured data values
+        """
+        data = r'<165>1 2003-10-11T22:14:15.003Z host app - - [id@1 dir="C:\\temp\\" x="1\]2"] msg'
+        expected = [{'identity': 'id@1', 'parameters': {'dir': 'C:\\temp\\', 'x': '1]2'}}]
+        result = list(jc.parsers.syslog_s.parse([data], quiet=True))
+        self.assertEqual(result[0]['structured_data'], expected)
+
+    def test_syslog_s_escaped_quote(self):
+        """
+        Test syslog line with escaped double quotes in structured data values
+        """
+        data = r'<165>1 2003-10-11T22:14:15.003Z host app - - [id@1 q="say \"hi\""] msg'
+        expected = [{'identity': 'id@1', 'parameters': {'q': 'say "hi"'}}]
+        result = list(jc.parsers.syslog_s.parse([data], quiet=True))
+        self.assertEqual(result[0]['structured_data'], expected)
+
+    def test_syslog_s_tab_separator(self):
+        """
+        Test syslog line with tabs separating the structured data identity and parameters
+        """
+        data = '<165>1 2003-10-11T22:14:15.003Z host app - - [id\ta="1"\tb="2"] msg'
+        expected = [{'identity': 'id', 'parameters': {'a': '1', 'b': '2'}}]
+        result = list(jc.parsers.syslog_s.parse([data], quiet=True))
+        self.assertEqual(result[0]['structured_data'], expected)
+
+    def test_syslog_s_no_parameters(self):
+        """
+        Test syslog line with a structured data element that has no parameters
+        """
+        data = '<165>1 2003-10-11T22:14:15.003Z host app - - [origin][id@1 a="1"] msg'
+        expected = [
+            {'identity': 'origin', 'parameters': {}},
+            {'identity': 'id@1', 'parameters': {'a': '1'}}
+        ]
+        result = list(jc.parsers.syslog_s.parse([data], quiet=True))
+        self.assertEqual(result[0]['structured_data'], expected)
+
+    def test_syslog_s_param_name(self):
+        """
+        Test syslog line with dashes and dots in a structured data parameter name
+        """
+        data = '<165>1 2003-10-11T22:14:15.003Z host app - - [meta sys-Up.Time="5"] msg'
+        expected = [{'identity': 'meta', 'parameters': {'sys-Up.Time': '5'}}]
+        result = list(jc.parsers.syslog_s.parse([data], quiet=True))
+        self.assertEqual(result[0]['structured_data'], expected)
+
+    def test_syslog_s_invalid_identity(self):
+        """
+        Test syslog line with structured data identities that are not valid SD-NAMEs
+        """
+        data = '<165>1 2003-10-11T22:14:15.003Z host app - - [' + 'x' * 33 + ' a="1"][i"d b="2"][i=d c="3"] msg'
+        expected = [
+            {'identity': None, 'parameters': {'a': '1'}},
+            {'identity': None, 'parameters': {'b': '2'}},
+            {'identity': None, 'parameters': {'c': '3'}}
+        ]
+        result = list(jc.parsers.syslog_s.parse([data], quiet=True))
+        self.assertEqual(result[0]['structured_data'], expected)
+
+    def test_syslog_s_unescaped_bracket_in_value(self):
+        """
+        Test syslog line where an unescaped ']' in a value ends the structured data element
+        """
+        data = '<165>1 2003-10-11T22:14:15.003Z host app - - [id@1 a="1" b="x]y" c="2"] msg'
+        expected = [{'identity': 'id@1', 'parameters': {'a': '1'}}]
+        result = list(jc.parsers.syslog_s.parse([data], quiet=True))
+        self.assertEqual(result[0]['structured_data'], expected)
+
+    def test_syslog_s_escaped_bracket_outside_value(self):
+        """
+        Test syslog line where an escaped ']' outside a value does not end the structured data element
+        """
+        data = r'<165>1 2003-10-11T22:14:15.003Z host app - - [id@1 a="1"\] more [ ] msg'
+        expected = [{'identity': 'id@1', 'parameters': {'a': '1'}}]
+        result = list(jc.parsers.syslog_s.parse([data], quiet=True))
+        self.assertEqual(result[0]['structured_data'], expected)
+        self.assertEqual(result[0]['message'], 'msg')
+
 
 if __name__ == '__main__':
     unittest.main()